@@ -125,13 +125,12 @@ class Coadded(Spectrum):
         Plot the spectrum.
 
         """
-        import matplotlib as mpl  # type: ignore
         import matplotlib.pyplot as plt  # type: ignore
 
         _, ax = plt.subplots()
         ax.minorticks_on()
         ax.tick_params(which="major", right="on", top="on", direction="in")
-        colors = mpl.colormaps["rainbow"](np.linspace(0, 1, len(self.uids)))
+        colors = self._rainbow(len(self.uids))
         for y, col in zip(self.data.values(), colors):
             ax.plot(self.grid, y, color=col)
 
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+import functools
 from typing import Optional
 
+import numpy as np
+
 from amespahdbpythonsuite.amespahdb import AmesPAHdb
 
 message = AmesPAHdb.message
@@ -39,6 +42,7 @@ class Data():
         self.uids = keywords.get("uids", list())
         self.model = keywords.get("model", dict())
         self.units = keywords.get("units", dict())
+        self._labels: dict = dict()
 
         if isinstance(d, dict):
             # Check if expected keywords are present in provided dictionary,
@@ -101,6 +105,43 @@ class Data():
             f"UIDS: {self.uids=}"
         )
 
+    def _axislabel(self, axis: str) -> str:
+        """
+        Return the axis label with its units formatted as inline LaTeX.
+        Labels are cached by label and unit, as formatting the unit is
+        relatively expensive.
+
+        :param axis: Key in the units dictionary, e.g., 'abscissa'.
+        :type axis: str
+
+        """
+        label = self.units[axis]["label"]
+        unit = self.units[axis]["unit"]
+
+        key = (label, unit)
+        if key not in self._labels:
+            self._labels[key] = f"{label} [{unit.to_string('latex_inline')}]"
+
+        return self._labels[key]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _rainbow(n: int) -> np.ndarray:
+        """
+        Return n colors evenly sampled from the rainbow colormap. The
+        colors are cached per n and returned read-only.
+
+        :param n: Number of colors.
+        :type n: int
+
+        """
+        import matplotlib as mpl  # type: ignore
+
+        colors = mpl.colormaps["rainbow"](np.linspace(0, 1, n))
+        colors.flags.writeable = False
+
+        return colors
+
     def getuids(self) -> list:
         """
         Return uid list.
@@ -35,7 +35,6 @@ class Fitted(Spectrum):
 
         """
 
-        import matplotlib as mpl  # type: ignore
         import matplotlib.gridspec as gs  # type: ignore
         import matplotlib.pyplot as plt  # type: ignore
 
@@ -139,7 +138,7 @@ class Fitted(Spectrum):
                 and not keywords.get("size", False)
                 and not keywords.get("composition", False)
             ):
-                colors = mpl.colormaps["rainbow"](np.linspace(0, 1, len(self.uids)))
+                colors = self._rainbow(len(self.uids))
                 for uid, col in zip(self.uids, colors):
                     axis[0].plot(x, self.data[uid], color=col)
 
@@ -1,17 +1,141 @@
 #!/usr/bin/env python3
-import copy
-from typing import Optional
+from __future__ import annotations
+
+import multiprocessing
+from typing import TYPE_CHECKING, Optional
 
 import numpy as np
-from scipy.spatial import KDTree  # type: ignore
-from scipy.spatial.distance import euclidean as edist  # type: ignore
-from vtkmodules.vtkRenderingCore import vtkAssembly  # type: ignore
 
 from amespahdbpythonsuite.amespahdb import AmesPAHdb
 from amespahdbpythonsuite.data import Data
 
+if TYPE_CHECKING:
+    from vtkmodules.vtkRenderingCore import vtkAssembly  # type: ignore
+
 message = AmesPAHdb.message
 
+# Ring types counted by Geometry.rings and their areas in Angstrom^2.
+_RINGS = ("three", "four", "five", "six", "seven", "eight")
+
+_AREA_WEIGHTS = np.array([0.848, 1.96, 3.37, 5.09, 7.12, 9.46])
+
+# Atomic masses in amu, indexed by atomic number.
+_ATOMIC_MASS = np.array(
+    [
+        0.0,
+        1.007940,
+        4.002602,
+        6.941000,
+        9.012182,
+        10.811000,
+        12.011000,
+        14.006740,
+        15.999400,
+        18.998404,
+        20.179701,
+        22.989767,
+        24.305000,
+        26.981539,
+        28.085501,
+        30.973763,
+        32.066002,
+        35.452702,
+        39.948002,
+        39.098301,
+        40.077999,
+        44.955910,
+        47.880001,
+        50.941502,
+        51.996101,
+        54.938049,
+        55.847000,
+        58.933201,
+        58.693401,
+        63.546001,
+        65.389999,
+        69.723000,
+        72.610001,
+        74.921593,
+        78.959999,
+        79.903999,
+        83.800003,
+        85.467796,
+        87.620003,
+        88.905853,
+        91.223999,
+        92.906380,
+        95.940002,
+        98.000000,
+        101.070000,
+        102.905502,
+        106.419998,
+        107.868202,
+        112.411003,
+        114.820000,
+        118.709999,
+        121.757004,
+        127.599998,
+        126.904472,
+        131.289993,
+        132.905426,
+        137.326996,
+        138.905502,
+        140.115005,
+        140.907654,
+        144.240005,
+        145.000000,
+        150.360001,
+        151.964996,
+        157.250000,
+        158.925339,
+        162.500000,
+        164.930313,
+        167.259995,
+        168.934204,
+        173.039993,
+        174.966995,
+        178.490005,
+        180.947906,
+        183.850006,
+        186.207001,
+        190.199997,
+        192.220001,
+        195.080002,
+        196.966537,
+        200.589996,
+        204.383301,
+        207.199997,
+        208.980377,
+        209.000000,
+        210.000000,
+        222.000000,
+        223.000000,
+        226.024994,
+        227.028000,
+        232.038101,
+        231.035904,
+        238.028900,
+        237.048004,
+        244.000000,
+        243.000000,
+        247.000000,
+        247.000000,
+        251.000000,
+        252.000000,
+        257.000000,
+        258.000000,
+        259.000000,
+        262.000000,
+        261.000000,
+        262.000000,
+        263.000000,
+        262.000000,
+        265.000000,
+        266.000000,
+    ]
+)
+_ATOMIC_MASS.flags.writeable = False
+
 
 class Geometry(Data):
     """
@@ -21,120 +145,7 @@ class Geometry(Data):
 
     def __init__(self, d: Optional[dict] = None, **keywords) -> None:
         super().__init__(d, **keywords)
-        self._atomic_mass = np.array(
-            [
-                0.0,
-                1.007940,
-                4.002602,
-                6.941000,
-                9.012182,
-                10.811000,
-                12.011000,
-                14.006740,
-                15.999400,
-                18.998404,
-                20.179701,
-                22.989767,
-                24.305000,
-                26.981539,
-                28.085501,
-                30.973763,
-                32.066002,
-                35.452702,
-                39.948002,
-                39.098301,
-                40.077999,
-                44.955910,
-                47.880001,
-                50.941502,
-                51.996101,
-                54.938049,
-                55.847000,
-                58.933201,
-                58.693401,
-                63.546001,
-                65.389999,
-                69.723000,
-                72.610001,
-                74.921593,
-                78.959999,
-                79.903999,
-                83.800003,
-                85.467796,
-                87.620003,
-                88.905853,
-                91.223999,
-                92.906380,
-                95.940002,
-                98.000000,
-                101.070000,
-                102.905502,
-                106.419998,
-                107.868202,
-                112.411003,
-                114.820000,
-                118.709999,
-                121.757004,
-                127.599998,
-                126.904472,
-                131.289993,
-                132.905426,
-                137.326996,
-                138.905502,
-                140.115005,
-                140.907654,
-                144.240005,
-                145.000000,
-                150.360001,
-                151.964996,
-                157.250000,
-                158.925339,
-                162.500000,
-                164.930313,
-                167.259995,
-                168.934204,
-                173.039993,
-                174.966995,
-                178.490005,
-                180.947906,
-                183.850006,
-                186.207001,
-                190.199997,
-                192.220001,
-                195.080002,
-                196.966537,
-                200.589996,
-                204.383301,
-                207.199997,
-                208.980377,
-                209.000000,
-                210.000000,
-                222.000000,
-                223.000000,
-                226.024994,
-                227.028000,
-                232.038101,
-                231.035904,
-                238.028900,
-                237.048004,
-                244.000000,
-                243.000000,
-                247.000000,
-                247.000000,
-                251.000000,
-                252.000000,
-                257.000000,
-                258.000000,
-                259.000000,
-                262.000000,
-                261.000000,
-                262.000000,
-                263.000000,
-                262.000000,
-                265.000000,
-                266.000000,
-            ]
-        )
+        self._atomic_mass = _ATOMIC_MASS
         self.set(d, **keywords)
 
     def set(self, d: Optional[dict] = None, **keywords) -> None:
@@ -144,6 +155,19 @@ class Geometry(Data):
         """
         Data.set(self, d, **keywords)
 
+        # Atoms per UID as read from self.data, together with their types
+        # and coordinates as arrays, rebuilt by _atoms() when the atoms
+        # in self.data change.
+        self._arrays: dict = dict()
+
+        # Bonded atom pairs and their squared distances per UID, found
+        # on demand by _neighbors() and dropped with stale atoms.
+        self._pairs: dict = dict()
+
+        # Ring counts per UID, computed on demand by rings() and dropped
+        # with stale atoms.
+        self._rings: dict = dict()
+
     def get(self) -> dict:
         """
         Assigns class variables from inherited dictionary.
@@ -184,41 +208,22 @@ class Geometry(Data):
 
         atom_symsize = np.array([1, 2, 3, 3, 3.5, 4, 4]) * keywords.get("scale", 100.0)
 
-        g = self.data[uid]
-        ng = len(g)
-
-        numn = np.zeros(ng, dtype=int)
-        nlist = np.full((ng, 6), -1, dtype=int)
+        pt, xyz = self._atoms(uid)
 
-        px = np.array([g["x"] for g in self.data[uid]])
-        py = np.array([g["y"] for g in self.data[uid]])
-        pz = np.array([g["z"] for g in self.data[uid]])
+        px, py, _ = xyz.T
 
         m = np.max([np.max(px), np.max(py)]) * 1.1
 
-        for x, y, z, i in zip(px, py, pz, range(ng)):
-            dd = np.sqrt((px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2)
-            sel = np.where((dd < 1.6))
-            nsel = len(sel[0])
-            numn[i] = nsel
-            nlist[i, 0:nsel] = sel[0]
+        # Each bond once, drawn from its first atom towards the second.
+        pairs, distances2 = self._neighbors(uid)
+        bonds = pairs[distances2 < 1.6**2]
 
         _, ax = plt.subplots()
         ax.set_xlim(-m, m)
         ax.set_ylim(-m, m)
 
-        for x, y, i in zip(px, py, range(ng)):
-            for j in range(numn[i]):
-                ax.plot([x, px[nlist[i, j]]], [y, py[nlist[i, j]]], c="black", lw=5)
-
-                numn[nlist[i, j]] -= 1
-                if numn[nlist[i, j]] > 0:
-                    nlist[nlist[i, j], np.where(nlist[nlist[i, j], :] == i)[0]] = -1
-                    nlist[nlist[i, j], :] = nlist[
-                        nlist[i, j], np.argsort(nlist[nlist[i, j], :])[::-1]
-                    ]
-
-        pt = np.array([g["type"] for g in self.data[uid]])
+        for i, j in bonds.tolist():
+            ax.plot([px[i], px[j]], [py[i], py[j]], c="black", lw=5)
 
         for i in range(len(atom_numbers)):
             ii = np.where(pt == atom_numbers[i])[0]
@@ -259,6 +264,7 @@ class Geometry(Data):
             vtkCylinderSource, vtkSphereSource)
         from vtkmodules.vtkIOImage import vtkPNGWriter  # type:  ignore
         from vtkmodules.vtkRenderingCore import (vtkActor,  # type: ignore
+                                                 vtkAssembly,
                                                  vtkPolyDataMapper,
                                                  vtkRenderer, vtkRenderWindow,
                                                  vtkRenderWindowInteractor,
@@ -280,88 +286,74 @@ class Geometry(Data):
         for number in atom_radii:
             atom_radii[number] *= scale
 
-        g = self.data[uid]
-        ng = len(g)
+        pt, xyz = self._atoms(uid)
 
-        numn = np.zeros(ng, dtype=int)
-        nlist = np.full((ng, 6), -1, dtype=int)
+        # Plain Python floats for the per-actor VTK calls.
+        positions = xyz.tolist()
 
-        px = np.array([g["x"] for g in self.data[uid]])
-        py = np.array([g["y"] for g in self.data[uid]])
-        pz = np.array([g["z"] for g in self.data[uid]])
-        pt = np.array([g["type"] for g in self.data[uid]])
+        # Each bond once, drawn from its first atom towards the second.
+        pairs, distances2 = self._neighbors(uid)
+        bonded = distances2 < 1.6**2
+        bonds = pairs[bonded]
 
-        for x, y, z, i in zip(px, py, pz, range(ng)):
-            dd = np.sqrt((px - x) ** 2 + (py - y) ** 2 + (pz - z) ** 2)
-            sel = np.where((dd < 1.6))
-            nsel = len(sel[0])
-            numn[i] = nsel
-            if nsel == 0:
-                continue
-            if nsel > 6:
-                ii = np.argsort(dd[sel])
-                sel = tuple([sel[0][ii[0:5]]])
-                nsel = 6
+        # Bond vectors, lengths and orientations, all at once.
+        vectors = xyz[bonds[:, 0]] - xyz[bonds[:, 1]]
+        norms = np.sqrt(distances2[bonded])
+        angles = np.zeros(len(bonds))
+        nonzero = norms != 0.0
+        angles[nonzero] = 180.0 * np.arccos(-vectors[nonzero, 2] / norms[nonzero]) / np.pi
+        hydrogens = (pt[bonds] == 1).any(1)
 
-            nlist[i, 0:nsel] = sel[0]
+        # A single unit cylinder, shared by all bonds and scaled to length.
+        cylinder = vtkCylinderSource()
+        cylinder.SetResolution(32)
+        cylinder.SetRadius(0.1)
+        cylinder.SetHeight(1.0)
+        cylinderMapper = vtkPolyDataMapper()
+        cylinderMapper.SetInputConnection(cylinder.GetOutputPort())
 
         assembly = vtkAssembly()
-        for x, y, z, t, i in zip(px, py, pz, pt, range(ng)):
-            for j in range(numn[i]):
-                numn[nlist[i, j]] -= 1
-                if numn[nlist[i, j]] > 0:
-                    nlist[nlist[i, j], np.where(nlist[nlist[i, j], :] == i)[0]] = -1
-                    nlist[nlist[i, j], :] = nlist[
-                        nlist[i, j], np.argsort(nlist[nlist[i, j], :])[::-1]
-                    ]
-
-                if nlist[i, j] < 0:
-                    continue
-
-                vec = np.array(
-                    (x - px[nlist[i, j]], y - py[nlist[i, j]], z - pz[nlist[i, j]])
-                )
-
-                norm = np.linalg.norm(vec)
-
-                cylinder = vtkCylinderSource()
-                cylinder.SetResolution(32)
-                cylinder.SetRadius(0.1)
-                cylinder.SetHeight(norm)  # type: ignore
-                cylinderMapper = vtkPolyDataMapper()
-                cylinderMapper.SetInputConnection(cylinder.GetOutputPort())
-                cylinderActor = vtkActor()
-                cylinderActor.SetMapper(cylinderMapper)
-                if t == 1 or pt[nlist[i, j]] == 1:
-                    cylinderActor.GetProperty().SetColor(0.78, 0.78, 0.78)
-                else:
-                    cylinderActor.GetProperty().SetColor(0.11, 0.11, 0.11)
-                cylinderTransform = vtkTransform()
-                cylinderTransform.Identity()
-                cylinderTransform.PostMultiply()
-                cylinderTransform.Translate(0.0, norm / 2.0, 0.0)
-                cylinderTransform.RotateX(90.0)
-                angle = 0.0
-                if norm != 0.0:
-                    angle = 180.0 * np.arccos(-vec[2] / norm) / np.pi
-                    if angle == 180.0:
-                        cylinderTransform.Translate(0.0, 0.0, -norm)
-                cylinderTransform.RotateWXYZ(angle, vec[1], -vec[0], 0.0)
-                cylinderTransform.Translate(x, y, z)
-                cylinderActor.SetUserTransform(cylinderTransform)
-                assembly.AddPart(cylinderActor)
+        for (i, _), (vx, vy, _), norm, angle, hydrogen in zip(
+            bonds.tolist(),
+            vectors.tolist(),
+            norms.tolist(),
+            angles.tolist(),
+            hydrogens.tolist(),
+        ):
+            cylinderActor = vtkActor()
+            cylinderActor.SetMapper(cylinderMapper)
+            if hydrogen:
+                cylinderActor.GetProperty().SetColor(0.78, 0.78, 0.78)
+            else:
+                cylinderActor.GetProperty().SetColor(0.11, 0.11, 0.11)
+            cylinderTransform = vtkTransform()
+            cylinderTransform.Identity()
+            cylinderTransform.PostMultiply()
+            cylinderTransform.Scale(1.0, norm, 1.0)
+            cylinderTransform.Translate(0.0, norm / 2.0, 0.0)
+            cylinderTransform.RotateX(90.0)
+            if angle == 180.0:
+                cylinderTransform.Translate(0.0, 0.0, -norm)
+            cylinderTransform.RotateWXYZ(angle, vy, -vx, 0.0)
+            cylinderTransform.Translate(*positions[i])
+            cylinderActor.SetUserTransform(cylinderTransform)
+            assembly.AddPart(cylinderActor)
 
         if not keywords.get("frame", False):
-            for x, y, z, t in zip(px, py, pz, pt):
+            # A single sphere per element, shared by all of its atoms.
+            sphereMappers = dict()
+            for t in np.unique(pt).tolist():
                 sphere = vtkSphereSource()
                 sphere.SetThetaResolution(32)
                 sphere.SetPhiResolution(32)
-                sphere.SetCenter(x, y, z)
                 sphere.SetRadius(atom_radii[t])
-                sphereMapper = vtkPolyDataMapper()
-                sphereMapper.SetInputConnection(sphere.GetOutputPort())
+                sphereMappers[t] = vtkPolyDataMapper()
+                sphereMappers[t].SetInputConnection(sphere.GetOutputPort())
+
+            for (x, y, z), t in zip(positions, pt.tolist()):
                 sphereActor = vtkActor()
-                sphereActor.SetMapper(sphereMapper)
+                sphereActor.SetMapper(sphereMappers[t])
+                sphereActor.SetPosition(x, y, z)
                 sphereActor.GetProperty().SetColor(atom_colors[t])
 
                 sphereActor.GetProperty().SetSpecular(0.25)
@@ -426,31 +418,35 @@ class Geometry(Data):
         Compute the moment of inertia.
 
         """
-        inertia = dict()
+        if not self.data:
+            return dict()
 
-        for uid, geometry in self.data.items():
+        atomic_mass = _ATOMIC_MASS
+        atoms = [self._atoms(uid) for uid in self.data]
 
-            m = self._atomic_mass[np.array([g["type"] for g in geometry], dtype=int)]
-            x = np.array([g["x"] for g in geometry])
-            y = np.array([g["y"] for g in geometry])
-            z = np.array([g["z"] for g in geometry])
+        # Pad all geometries to a common number of atoms, padded atoms
+        # carry no mass and do not contribute.
+        nmax = max(len(types) for types, _ in atoms)
 
-            tensor11 = np.sum(m * (y**2 + z**2))
-            tensor22 = np.sum(m * (x**2 + z**2))
-            tensor33 = np.sum(m * (x**2 + y**2))
-            tensor12 = -np.sum(m * x * y)
-            tensor13 = -np.sum(m * x * z)
-            tensor23 = -np.sum(m * y * z)
+        m = np.zeros((len(atoms), nmax))
+        r = np.zeros((len(atoms), nmax, 3))
 
-            inertia[uid] = np.array(
-                [
-                    [tensor11, tensor12, tensor13],
-                    [tensor12, tensor22, tensor23],
-                    [tensor13, tensor23, tensor33],
-                ],
-            )
+        for u, (types, xyz) in enumerate(atoms):
+            n = len(types)
+            m[u, :n] = atomic_mass[types]
+            r[u, :n] = xyz
+
+        # Second moments for all UIDs at once as a stacked matrix product,
+        # from which the inertia tensors follow as I = tr(S)E - S.
+        s = (m[:, :, None] * r).transpose(0, 2, 1) @ r
+
+        # The off-diagonal terms come from separate reductions and can
+        # differ in the last digits, restore the exact symmetry.
+        s = 0.5 * (s + s.transpose(0, 2, 1))
 
-        return inertia
+        inertia = np.trace(s, axis1=1, axis2=2)[:, None, None] * np.eye(3) - s
+
+        return dict(zip(self.data.keys(), inertia))
 
     def diagonalize(self, full: bool = False, equal: bool = False) -> None:
         """
@@ -459,64 +455,49 @@ class Geometry(Data):
 
         """
         if not equal:
-            masses = copy.copy(self._atomic_mass)
+            masses = _ATOMIC_MASS.copy()
             masses[[12, 26]] = 0.0
         else:
-            masses = np.ones(len(self._atomic_mass))
-
-        for geometry in self.data.values():
-            coordinates = np.array(
-                [
-                    [g["x"] for g in geometry],
-                    [g["y"] for g in geometry],
-                    [g["z"] for g in geometry],
-                ]
-            )
+            masses = np.ones(len(_ATOMIC_MASS))
 
-            m = np.resize(
-                masses[np.array([g["type"] for g in geometry], dtype=int)],
-                coordinates.shape,
-            )
+        if not self.data:
+            return
 
-            coordinates -= np.resize(
-                np.sum(coordinates * m, 1) / np.sum(m, 1),
-                tuple(reversed(coordinates.shape)),
-            ).T
-
-            tensor = np.diag(
-                [
-                    np.sum(m[0, :] * coordinates[0, :] ** 2),
-                    np.sum(m[1, :] * coordinates[1, :] ** 2),
-                    np.sum(m[2, :] * coordinates[2, :] ** 2),
-                ]
-            )
+        centered = list()
+        tensors = list()
 
-            if full:
-                tensor -= np.diag(
-                    [
-                        np.sum(m[:, 0] * coordinates[:, 0] * coordinates[:, 1]),
-                        np.sum(m[:, 2] * coordinates[:, 1] * coordinates[:, 2]),
-                        1.0,
-                    ]
-                )
+        for uid in self.data:
+            types, xyz = self._atoms(uid)
 
-                tensor += np.diag(np.diag(tensor, 1), -1)
+            m = masses[types]
 
-                tensor[0, 2] = -np.sum(m[:, 1] * coordinates[:, 0] * coordinates[:, 2])
+            coordinates = np.ascontiguousarray(xyz.T)
 
-                tensor[2, 0] = [0, 2]
+            coordinates -= (coordinates * m).sum(1, keepdims=True) / m.sum()
+
+            # Second moments of the mass distribution, the principal axes
+            # of which coincide with those of the inertia tensor. Without
+            # full, only the diagonal is needed.
+            if full:
+                tensor = (m * coordinates) @ coordinates.T
+            else:
+                tensor = np.diag((m * coordinates**2).sum(1))
 
-            v, w = np.linalg.eig(tensor)
+            centered.append(coordinates)
+            tensors.append(tensor)
 
-            for i in range(len(geometry)):
-                coordinates[:, i] = np.matmul(w, coordinates[:, i])
+        # The tensors are symmetric, diagonalize them all in one go.
+        values, vectors = np.linalg.eigh(np.stack(tensors))
 
-            coordinates = coordinates[np.argsort(v)[::-1], :]
+        for (uid, geometry), coordinates, v, w in zip(
+            self.data.items(), centered, values, vectors
+        ):
+            coordinates = (w.T @ coordinates)[np.argsort(v)[::-1], :]
 
-            for g, i in zip(geometry, range(len(geometry))):
-                g["x"] = coordinates[0, i]
-                g["y"] = coordinates[1, i]
-                g["z"] = coordinates[2, i]
+            for g, (x, y, z) in zip(geometry, coordinates.T.tolist()):
+                g["x"] = x
+                g["y"] = y
+                g["z"] = z
 
     def mass(self) -> dict:
         """
@@ -524,260 +505,98 @@ class Geometry(Data):
 
         """
 
-        mass = dict()
+        if not self.data:
+            return dict()
 
-        for uid, geometry in self.data.items():
-            mass[uid] = np.sum(
-                self._atomic_mass[np.array([g["type"] for g in geometry], dtype=int)]
+        types = [self._atoms(uid)[0] for uid in self.data]
+
+        # Sum the atomic masses of all UIDs at once, each starting at its
+        # offset into the concatenated atom types. reduceat does not give
+        # zero for empty segments, so only UIDs with atoms take part.
+        counts = np.array([len(t) for t in types])
+        nonempty = counts > 0
+
+        mass = np.zeros(len(types))
+        if nonempty.any():
+            offsets = np.cumsum(counts) - counts
+            mass[nonempty] = np.add.reduceat(
+                _ATOMIC_MASS[np.concatenate(types)], offsets[nonempty]
             )
 
-        return mass
+        return dict(zip(self.data.keys(), mass))
 
-    def rings(self) -> dict:
+    def rings(self, **keywords) -> dict:
         """
         Computes the number of rings per type.
 
         """
 
-        rings = dict()
-
-        for uid, geometry in self.data.items():
-
-            num = {"three": 0, "four": 0, "five": 0, "six": 0, "seven": 0, "eight": 0}
-
-            x = np.array([g["x"] for g in geometry])
-
-            y = np.array([g["y"] for g in geometry])
-
-            z = np.array([g["z"] for g in geometry])
-
-            numn = np.zeros(x.shape, dtype=int)
-
-            nlist = np.zeros((x.shape[0], 6), dtype=int)
-
-            for i in range(x.shape[0]):
-                dd = np.sqrt((x - x[i]) ** 2 + (y - y[i]) ** 2 + (z - z[i]) ** 2)
-
-                bounds = np.where((dd > 0.0) & (dd < 1.7))[0]
-
-                numn[i] = len(bounds)
-
-                nlist[i, 0:numn[i]] = bounds
-
-            iring = np.zeros(9, dtype=int)
-
-            for i in range(x.shape[0]):
-
-                iring[0] = i
-
-                for j in range(numn[i]):
-
-                    i2 = nlist[i, j]
-
-                    if i2 < i:
-                        continue
-
-                    iring[1] = i2
-
-                    for k in range(numn[i2]):
-
-                        i3 = nlist[i2, k]
-
-                        if i3 < i:
-                            continue
-
-                        iring[2] = i3
-
-                        if i3 != i:
-
-                            for r in range(numn[i3]):
-
-                                i4 = nlist[i3, r]
-
-                                if i4 < i:
-                                    continue
-
-                                iring[3] = i4
-
-                                if i4 == i2:
-                                    continue
-
-                                if i4 != i or iring[1] < iring[2]:
-
-                                    for m in range(numn[i4]):
-
-                                        i5 = nlist[i4, m]
-
-                                        if i5 < i:
-                                            continue
-
-                                        iring[4] = i5
-
-                                        if i5 == i2 or i5 == i3:
-                                            continue
-
-                                        if i5 != i or iring[1] < iring[3]:
-
-                                            for n in range(numn[i5]):
-
-                                                i6 = nlist[i5, n]
-
-                                                if i6 < i:
-                                                    continue
-
-                                                iring[5] = i6
-
-                                                if i6 == i2 or i6 == i3 or i6 == i4:
-                                                    continue
-
-                                                if i6 != i or iring[1] < iring[4]:
-
-                                                    for o in range(numn[i6]):
-
-                                                        i7 = nlist[i6, o]
-
-                                                        if i7 < i:
-                                                            continue
-
-                                                        iring[6] = i7
-
-                                                        if (
-                                                            i7 == i2
-                                                            or i7 == i3
-                                                            or i7 == i4
-                                                            or i7 == i5
-                                                        ):
-                                                            continue
-
-                                                        if (
-                                                            i7 != i
-                                                            or iring[1] < iring[5]
-                                                        ):
-
-                                                            for p in range(numn[i7]):
-
-                                                                i8 = nlist[i7, p]
-
-                                                                if i8 < i:
-                                                                    continue
-
-                                                                iring[7] = i8
-
-                                                                if (
-                                                                    i8 == i2
-                                                                    or i8 == i3
-                                                                    or i8 == i4
-                                                                    or i8 == i5
-                                                                    or i8 == i6
-                                                                ):
-                                                                    continue
-
-                                                                if (
-                                                                    i8 != i
-                                                                    or iring[1]
-                                                                    < iring[6]
-                                                                ):
-
-                                                                    for q in range(
-                                                                        numn[i8]
-                                                                    ):
-
-                                                                        i9 = nlist[
-                                                                            i8, q
-                                                                        ]
-
-                                                                        if i9 < i:
-                                                                            continue
-
-                                                                        iring[8] = i9
-
-                                                                        if (
-                                                                            i9 == i2
-                                                                            or i9 == i3
-                                                                            or i9 == i4
-                                                                            or i9 == i5
-                                                                            or i9 == i6
-                                                                            or i9 == i7
-                                                                        ):
-                                                                            continue
-
-                                                                        if (
-                                                                            i9 != i
-                                                                            or iring[1]
-                                                                            < iring[7]
-                                                                        ):
-                                                                            continue
-
-                                                                        else:
-                                                                            num[
-                                                                                "eight"
-                                                                            ] += 1
-                                                                else:
-                                                                    num["seven"] += 1
-
-                                                        else:
-                                                            num["six"] += 1
-
-                                                else:
-                                                    num["five"] += 1
-
-                                        else:
-                                            num["four"] += 1
-
-                                else:
-                                    num["three"] += 1
+        todo: dict = dict()
+        for uid in self.data:
+            # Looking up the atoms first drops counts gone stale.
+            n = len(self._atoms(uid)[0])
+            if uid not in self._rings:
+                todo[uid] = (n, self._neighbors(uid)[0])
+
+        if keywords.get("multiprocessing", False) and len(todo) > 1:
+            ncores = keywords.get("ncores", max(multiprocessing.cpu_count() - 1, 1))
+            message(f"USING MULTIPROCESSING WITH {ncores} CORES")
+            pool = multiprocessing.Pool(processes=ncores)
+            counts = pool.starmap(Geometry._count_rings, todo.values())
+
+            pool.close()
+            pool.join()
+        else:
+            counts = [Geometry._count_rings(n, pairs) for n, pairs in todo.values()]
 
-            rings[uid] = num
+        self._rings.update(zip(todo.keys(), counts))
 
-        return rings
+        return {uid: dict(zip(_RINGS, self._rings[uid].tolist())) for uid in self.data}
 
-    def area(self) -> dict:
+    def area(self, **keywords) -> dict:
         """
         Computes the area.
 
         """
 
-        per_ring = {
-            "three": 0.848,
-            "four": 1.96,
-            "five": 3.37,
-            "six": 5.09,
-            "seven": 7.12,
-            "eight": 9.46,
-        }
+        self.rings(**keywords)
 
-        area = dict()
+        if not self.data:
+            return dict()
 
-        rings = self.rings()
-        for uid, nr in rings.items():
-            a = 0.0
-            for r, n in nr.items():
-                a += per_ring[r] * n
-            area[uid] = a
+        area = np.stack([self._rings[uid] for uid in self.data]) @ _AREA_WEIGHTS
 
-        return area
+        return dict(zip(self.data.keys(), area.tolist()))
 
-    def bec(self) -> dict:
+    def bec(self, **keywords) -> dict:
         """Convert PAH carbon and hydrogen positions to a boundary-edge
         code. Only makes sense to use this for regular PAHs. Return of
         a tuple with a list of boundary carbons traversed in order and
         the boundary-edge code. By Dr. Joseph E. Roser
         <Joseph.E.Roser@nasa.gov>"""
 
-        becodes = dict()
-        for uid, geometry in self.data.items():
-            becode = self.__becode(
-                [(g["x"], g["y"], g["z"]) for g in geometry if g["type"] == 6],
-                [(g["x"], g["y"], g["z"]) for g in geometry if g["type"] == 1],
-            )
-            becodes[uid] = becode[1]
+        atoms = list()
+        for uid in self.data:
+            types, xyz = self._atoms(uid)
+            atoms.append((xyz[types == 6], xyz[types == 1]))
+
+        if keywords.get("multiprocessing", False) and len(atoms) > 1:
+            ncores = keywords.get("ncores", max(multiprocessing.cpu_count() - 1, 1))
+            message(f"USING MULTIPROCESSING WITH {ncores} CORES")
+            pool = multiprocessing.Pool(processes=ncores)
+            becodes = pool.starmap(Geometry._becode, atoms)
+
+            pool.close()
+            pool.join()
+        else:
+            becodes = [Geometry._becode(carbons, hydrogens) for carbons, hydrogens in atoms]
 
-        return becodes
+        return {uid: becode[1] for uid, becode in zip(self.data, becodes)}
 
-    def __becode(
-        self,
-        allcarbons: list[tuple[float, float, float]],
-        allhydrogens: list[tuple[float, float, float]],
+    @staticmethod
+    def _becode(
+        allcarbons: np.ndarray,
+        allhydrogens: np.ndarray,
     ) -> tuple:
         """The star of the show here is the function PAHbecode, which answers
         the challenge of converting a list of PAH carbon atom and
@@ -803,39 +622,46 @@ class Geometry(Data):
 
         """
 
+        from scipy.spatial import KDTree  # type: ignore
+
+        allcarbons = np.ascontiguousarray(allcarbons, dtype=np.float64)
+        allhydrogens = np.ascontiguousarray(allhydrogens, dtype=np.float64)
+
         # Step 1: Find any boundary edge.
         carbontree = KDTree(allcarbons)
 
+        # Plain Python floats for the scalar work in the traversal
+        carbons = allcarbons.tolist()
+
         # Compute the center of mass of the carbon atom distribution
-        carbon_center = [
-            sum([Catom[i] for Catom in allcarbons]) / len(allcarbons)
-            for i in range(0, 3)
-        ]
+        carbon_center = allcarbons.mean(0)
 
-        # Rank distances of all carbon atoms from the center point
-        _, indices = carbontree.query(x=carbon_center, k=len(allcarbons))
+        # The carbon atom farthest from the center point
+        farthest = np.argmax(((allcarbons - carbon_center) ** 2).sum(1))
 
-        # Initialize boundary_carbons list
-        boundary_carbons = [allcarbons[indices[-1]]]
-        _, nindex = carbontree.query(x=boundary_carbons[0], k=2)
-        boundary_carbons.append(allcarbons[nindex[-1]])
+        # Initialize the boundary, tracked as indices into allcarbons
+        boundary = [int(farthest)]
+        _, nindex = carbontree.query(x=allcarbons[boundary[0]], k=2)
+        boundary.append(int(nindex[-1]))
+
+        # The same indices as a set, for constant time membership tests
+        visited = set(boundary)
 
         # Step 2: We need to specify a vector that is roughly normal
         # to the surface of the PAH molecule.
-        v0 = np.subtract(boundary_carbons[0], carbon_center)
-        v1 = np.subtract(boundary_carbons[1], carbon_center)
-        normal = np.cross(v1, v0)
+        v0 = allcarbons[boundary[0]] - carbon_center
+        v1 = allcarbons[boundary[1]] - carbon_center
+        normal = np.cross(v1, v0).tolist()
 
         # Step 3: A length scale for bounding carbon-carbon nearest
         # neighbor searches
-        dscale = 1.366025404 * edist(boundary_carbons[0], boundary_carbons[1])
+        dscale = 1.366025404 * np.sqrt(
+            np.sum((allcarbons[boundary[0]] - allcarbons[boundary[1]]) ** 2)
+        )
 
         # Step 4: Which carbon atom neighbor of a given hydrogen atom
         # is really the one that it is bound to?
-        hydrogenated_carbons = [
-            allcarbons[index]
-            for index in map(lambda y: carbontree.query(x=y)[1], allhydrogens)
-        ]
+        hydrogenated_carbons = set(carbontree.query(allhydrogens, k=1)[1].tolist())
 
         # Step 5: Traverse the boundary step by step and add in the
         # boundary carbon atoms one by one.
@@ -843,37 +669,44 @@ class Geometry(Data):
             # Step 6: Look for carbon atoms one "hex vertex" away from
             # the current end point of the boundary traversal.
             _, indexlist = carbontree.query(
-                x=boundary_carbons[-1], k=4, distance_upper_bound=dscale
+                x=allcarbons[boundary[-1]], k=4, distance_upper_bound=dscale
             )
 
             # Reject duplicate boundary points and invalid indicies in
             # indexlist
-            trial_carbons = list(
-                filter(
-                    lambda x: x not in boundary_carbons,
-                    [allcarbons[item] for item in indexlist if item < len(allcarbons)],
-                )
-            )
+            trial_carbons = [
+                item
+                for item in indexlist.tolist()
+                if item < len(allcarbons) and item not in visited
+            ]
 
             # Step 7: Update the boundary carbon atoms list.
             if len(trial_carbons) == 0:
                 message("BEC ERROR: SEARCH FOUND TOO FEW NEAREST-NEIGHBOR POINTS")
                 break
             elif len(trial_carbons) == 1:
-                boundary_carbons.extend(trial_carbons)
+                boundary.extend(trial_carbons)
+                visited.update(trial_carbons)
             elif len(trial_carbons) == 2:
                 # Compute an edge vector for the most recently added boundary edge
-                edgevector = np.subtract(boundary_carbons[-1], boundary_carbons[-2])
+                end = carbons[boundary[-1]]
+                edgevector = [a - b for a, b in zip(end, carbons[boundary[-2]])]
+
+                # As normal . (trial x edge) = trial . (edge x normal),
+                # the cross product is taken once for both candidates
+                ex, ey, ez = edgevector
+                nx, ny, nz = normal
+                w = [ey * nz - ez * ny, ez * nx - ex * nz, ex * ny - ey * nx]
 
                 # If the boundary end point is hydrogenated, we move
                 # "clockwise", otherwise "counter-clockwise"
-                for Catom in trial_carbons:
-                    trialvector = np.subtract(Catom, boundary_carbons[-1])
-                    ivalue = self.__indicator(trialvector, edgevector, normal)
-                    if not np.logical_xor(
-                        ivalue == 1.0, boundary_carbons[-1] in hydrogenated_carbons
-                    ):
-                        boundary_carbons.append(Catom)
+                hydrogenated = boundary[-1] in hydrogenated_carbons
+                for item in trial_carbons:
+                    trialvector = [a - b for a, b in zip(carbons[item], end)]
+                    ivalue = Geometry.__indicator(trialvector, w)
+                    if (ivalue == 1) == hydrogenated:
+                        boundary.append(item)
+                        visited.add(item)
                         break
             else:
                 message("BEC ERROR: SEARCH FOUND TOO MANY NEAREST-NEIGHBOR POINTS")
@@ -885,70 +718,290 @@ class Geometry(Data):
             becode = "6"
         else:
             # Compute a PC-1 code from boundary_carbons
-            pcone_code = [
-                "0" if Catom in hydrogenated_carbons else "1"
-                for Catom in boundary_carbons
-            ]
+            pcone_code = "".join(
+                ["0" if item in hydrogenated_carbons else "1" for item in boundary]
+            )
 
             # Compute the boundary-edge code and its reversed
             # equivalent
-            becode = self.__pcone_to_be(pcone_code)
-            pcone_code.reverse()
-            reverse_becode = self.__pcone_to_be(pcone_code)
+            becode = Geometry.__pcone_to_be(pcone_code)
+            reverse_becode = Geometry.__pcone_to_be(pcone_code[::-1])
 
             # Convert the boundary-edge code to its lexicographically
             # maximum equalivalent.
             if len(becode) > 2:
-                forward_best = max(
-                    [becode[i:] + becode[:i] for i in range(0, len(becode))]
-                )
-                reverse_best = max(
-                    [
-                        reverse_becode[i:] + reverse_becode[:i]
-                        for i in range(0, len(becode))
-                    ]
+                becode = max(
+                    Geometry.__max_rotation(becode),
+                    Geometry.__max_rotation(reverse_becode),
                 )
-                becode = max(forward_best, reverse_best)
 
         # Step 9: Return a tuple containing the boundary-edge list
         # (with an extra point for boundary closure) and the computed
         # boundary edge code
-        boundary_carbons.append(boundary_carbons[0])
-        return (boundary_carbons, becode)
+        boundary.append(boundary[0])
+        return (allcarbons[boundary], becode)
 
+    @staticmethod
     def __indicator(
-        self,
-        v1: np.ndarray,
-        v2: np.ndarray,
-        normal: np.ndarray,
-    ) -> float:
+        v1: list,
+        w: list,
+    ) -> int:
         """Returns the sign of normal dot (v1 cross v2) assuming that these
-        are 3-element sequences of some kind. By Dr. Joseph E. Roser
+        are 3-element sequences of some kind, given w = v2 cross normal,
+        i.e., the sign of v1 dot w. By Dr. Joseph E. Roser
         <Joseph.E.Roser@nasa.gov
 
         """
-        value = 0.0
-        value += normal[0] * (v1[1] * v2[2] - v1[2] * v2[1])
-        value += normal[1] * (v1[2] * v2[0] - v1[0] * v2[2])
-        value += normal[2] * (v1[0] * v2[1] - v1[1] * v2[0])
-        return np.sign(value)
+        value = v1[0] * w[0] + v1[1] * w[1] + v1[2] * w[2]
+        return (value > 0.0) - (value < 0.0)
 
-    def __pcone_to_be(self, pcone_code: list[str]) -> str:
+    @staticmethod
+    def __pcone_to_be(pcone_code: str) -> str:
         """Converts the PC-1 code of a PAH to its boundary-edge code.  By
         Dr. Joseph E. Roser <Joseph.E.Roser@nasa.gov
 
         """
-        becode = ""
-        csum = 0
-        try:
-            x = pcone_code.index("1")
-        except ValueError:
+        x = pcone_code.find("1")
+        if x < 0:
             return ""
 
-        for item in pcone_code[x + 1:] + pcone_code[: x + 1]:
-            if item == "0":
-                csum += 1
+        # Rotated to start just after the first "1", every run of "0"s
+        # closed by a "1" contributes its length plus one.
+        runs = (pcone_code[x + 1:] + pcone_code[: x + 1]).split("1")[:-1]
+        return "".join([str(len(run) + 1) for run in runs])
+
+    @staticmethod
+    def __max_rotation(code: str) -> str:
+        """Returns the lexicographically maximum rotation of a code in
+        linear time, comparing two candidate starting points at a time
+        and discarding the one that loses.
+
+        """
+        n = len(code)
+        doubled = code + code
+        i, j, k = 0, 1, 0
+        while i < n and j < n and k < n:
+            a, b = doubled[i + k], doubled[j + k]
+            if a == b:
+                k += 1
+                continue
+            if a < b:
+                i += k + 1
             else:
-                becode += str(csum + 1)
-                csum = 0
-        return becode
+                j += k + 1
+            if i == j:
+                j += 1
+            k = 0
+        start = min(i, j)
+        return doubled[start:start + n]
+
+    def _atoms(self, uid: int) -> tuple:
+        """
+        Atom types and coordinates of a single geometry as arrays,
+        cached for as long as its atoms in self.data are unchanged.
+
+        :param uid: UID of the geometry.
+        :type uid: int
+
+        :return: Atomic numbers and (N, 3) coordinates.
+        :rtype: tuple
+
+        """
+
+        # self.data is public and may have been edited in place, compare
+        # against the atoms the arrays were built from.
+        atoms = [(g["type"], g["x"], g["y"], g["z"]) for g in self.data[uid]]
+
+        cached = self._arrays.get(uid)
+        if cached is None or cached[0] != atoms:
+            self._pairs.pop(uid, None)
+            self._rings.pop(uid, None)
+            a = np.array(atoms, dtype=float).reshape(-1, 4)
+            cached = (atoms, a[:, 0].astype(int), np.ascontiguousarray(a[:, 1:]))
+            self._arrays[uid] = cached
+
+        return cached[1:]
+
+    def _neighbors(self, uid: int) -> tuple:
+        """
+        Atom pairs of a single geometry within 1.7 Angstrom and their
+        squared distances, found once and cached.
+
+        :param uid: UID of the geometry.
+        :type uid: int
+
+        :return: Indices of the atom pairs and their squared distances.
+        :rtype: tuple
+
+        """
+
+        if uid not in self._pairs:
+            from scipy.spatial import KDTree  # type: ignore
+
+            xyz = self._atoms(uid)[1]
+            pairs = KDTree(xyz).query_pairs(r=1.7, output_type="ndarray")
+            distances2 = ((xyz[pairs[:, 0]] - xyz[pairs[:, 1]]) ** 2).sum(1)
+            self._pairs[uid] = (pairs, distances2)
+
+        return self._pairs[uid]
+
+    @staticmethod
+    def _neighborlist(n: int, pairs: np.ndarray) -> tuple:
+        """
+        Build a neighbor list from bonded atom pairs, such as returned by
+        :meth:`scipy.spatial.KDTree.query_pairs`.
+
+        :param n: Number of atoms.
+        :type n: int
+        :param pairs: Indices of bonded atom pairs.
+        :type pairs: numpy.ndarray
+
+        :return: Number of neighbors per atom and the -1 padded neighbor list.
+        :rtype: tuple
+
+        """
+
+        # Each bond in both directions, grouped by atom.
+        bonds = np.concatenate((pairs, pairs[:, ::-1]))
+        bonds = bonds[np.lexsort((bonds[:, 1], bonds[:, 0]))]
+
+        numn = np.bincount(bonds[:, 0], minlength=n)
+
+        nlist = np.full((n, numn.max(initial=0)), -1, dtype=np.int32)
+        nlist[bonds[:, 0], np.arange(len(bonds)) - (np.cumsum(numn) - numn)[bonds[:, 0]]] = bonds[:, 1]
+
+        return numn, nlist
+
+    @staticmethod
+    def _count_rings(n: int, pairs: np.ndarray) -> np.ndarray:
+        """
+        Count the rings in a single geometry, used by
+        :meth:`amespahdbpythonsuite.geometry.Geometry.rings`, also
+        when multiprocessing is required.
+
+        :param n: Number of atoms of a single PAH.
+        :type n: int
+        :param pairs: Indices of its bonded atom pairs.
+        :type pairs: numpy.ndarray
+
+        :return: Number of three- through eight-membered rings.
+        :rtype: numpy.ndarray
+
+        """
+
+        # Counts of three- through eight-membered rings.
+        num = [0] * 6
+
+        # Atoms with fewer than two bonds, e.g., hydrogens, cannot be part
+        # of a ring, strip them until none are left.
+        keep = np.ones(n, dtype=bool)
+        while True:
+            strip = keep & (np.bincount(pairs.ravel(), minlength=n) < 2)
+            if not strip.any():
+                break
+            keep &= ~strip
+            pairs = pairs[keep[pairs].all(1)]
+
+        # Renumber the remaining atoms consecutively.
+        numn, nlist = Geometry._neighborlist(int(keep.sum()), (np.cumsum(keep) - 1)[pairs])
+
+        # Each atom's neighbors as a list of Python integers, visited atoms
+        # are tracked as bits of a Python integer, which needs Python
+        # rather than fixed-width numpy integers.
+        neighbors = [row[:n] for row, n in zip(nlist.tolist(), numn.tolist())]
+
+        # Rings are counted once, starting from their lowest atom index
+        # and traversed in a single direction.
+        for i, ni in enumerate(neighbors):
+
+            # Hops from i over atoms above it, up to four. A path can only
+            # close into a ring of at most eight atoms while it stays
+            # within reach of i, atoms below i are never reached.
+            hops = [9] * len(neighbors)
+            hops[i] = 0
+            front = [i]
+            for h in range(1, 5):
+                reached = []
+                for j in front:
+                    for k in neighbors[j]:
+                        if k > i and hops[k] == 9:
+                            hops[k] = h
+                            reached.append(k)
+                front = reached
+
+            for i2 in ni:
+
+                if i2 < i:
+                    continue
+
+                for i3 in neighbors[i2]:
+
+                    if i3 <= i:
+                        continue
+
+                    seen3 = 1 << i2 | 1 << i3
+
+                    for i4 in neighbors[i3]:
+
+                        if i4 < i or 1 << i4 & seen3:
+                            continue
+
+                        if i4 == i:
+                            if i2 > i3:
+                                num[0] += 1
+                            continue
+
+                        seen4 = seen3 | 1 << i4
+
+                        for i5 in neighbors[i4]:
+
+                            if hops[i5] > 4 or 1 << i5 & seen4:
+                                continue
+
+                            if i5 == i:
+                                if i2 > i4:
+                                    num[1] += 1
+                                continue
+
+                            seen5 = seen4 | 1 << i5
+
+                            for i6 in neighbors[i5]:
+
+                                if hops[i6] > 3 or 1 << i6 & seen5:
+                                    continue
+
+                                if i6 == i:
+                                    if i2 > i5:
+                                        num[2] += 1
+                                    continue
+
+                                seen6 = seen5 | 1 << i6
+
+                                for i7 in neighbors[i6]:
+
+                                    if hops[i7] > 2 or 1 << i7 & seen6:
+                                        continue
+
+                                    if i7 == i:
+                                        if i2 > i6:
+                                            num[3] += 1
+                                        continue
+
+                                    seen7 = seen6 | 1 << i7
+
+                                    for i8 in neighbors[i7]:
+
+                                        if hops[i8] > 1 or 1 << i8 & seen7:
+                                            continue
+
+                                        if i8 == i:
+                                            if i2 > i7:
+                                                num[4] += 1
+                                            continue
+
+                                        # Within one hop, i8 closes an
+                                        # eight-membered ring.
+                                        if i2 > i8:
+                                            num[5] += 1
+
+        return np.array(num)
@@ -66,34 +66,38 @@ class Laboratory(Data):
         if filename == "":
             filename = self.__class__.__name__ + ".tbl"
 
-        hdr = list()
-
-        kv = {
-            "DATE": datetime.datetime.now()
-            .astimezone()
-            .replace(microsecond=0)
-            .isoformat(),
-            "ORIGIN": "NASA Ames Research Center",
-            "CREATOR": f"Python {sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            "SOFTWARE": "AmesPAHdbPythonSuite",
-            "AUTHOR": "Dr. C. Boersma",
-            "TYPE": self.__class__.__name__.upper(),
-            "SPECIES": str(len(self.data)),
-        }
-
-        for key, value in kv.items():
-            if not value.isnumeric():
-                hdr.append(f"{key:8} = '{value}'")
-            else:
-                hdr.append(f"{key:8} = {value}")
+        date = datetime.datetime.now().astimezone().replace(microsecond=0).isoformat()
+        version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+        # Only the species count is numeric and written unquoted.
+        hdr = [
+            f"DATE     = '{date}'",
+            "ORIGIN   = 'NASA Ames Research Center'",
+            f"CREATOR  = 'Python {version}'",
+            "SOFTWARE = 'AmesPAHdbPythonSuite'",
+            "AUTHOR   = 'Dr. C. Boersma'",
+            f"TYPE     = '{self.__class__.__name__.upper()}'",
+            f"SPECIES  = {len(self.data)}",
+        ]
+
+        # Fill the columns in a single pass over the data.
+        total = sum(len(v["frequency"]) for v in self.data.values())
+        uids = np.empty(total, dtype=int)
+        frequency = np.empty(total)
+        intensity = np.empty(total)
+        offset = 0
+        for uid, v in self.data.items():
+            n = len(v["frequency"])
+            uids[offset:offset + n] = uid
+            frequency[offset:offset + n] = v["frequency"]
+            intensity[offset:offset + n] = v["intensity"]
+            offset += n
 
         tbl = Table(
             [
-                [uid for uid, v in self.data.items() for _ in v["frequency"]],
-                np.array([f for v in self.data.values() for f in v["frequency"]])
-                * self.units["abscissa"]["unit"],
-                np.array([t for v in self.data.values() for t in v["intensity"]])
-                * self.units["ordinate"]["unit"],
+                uids,
+                frequency * self.units["abscissa"]["unit"],
+                intensity * self.units["ordinate"]["unit"],
             ],
             names=["UID", "FREQUENCY", "INTENSITY"],
             meta={"comments": hdr},
@@ -108,28 +112,24 @@ class Laboratory(Data):
         Plot the spectrum.
 
         """
-        import matplotlib as mpl  # type: ignore
         import matplotlib.pyplot as plt  # type: ignore
+        from matplotlib.collections import LineCollection  # type: ignore
 
         _, ax = plt.subplots()
         ax.minorticks_on()
         ax.tick_params(which="major", right="on", top="on", direction="in")
-        colors = mpl.colormaps["rainbow"](np.linspace(0, 1, len(self.uids)))
-        for d, col in zip(self.data.values(), colors):
-            ax.plot(d["frequency"], d["intensity"], color=col)
-
-        ax.set_xlabel(
-            self.units["abscissa"]["label"]
-            + " ["
-            + self.units["abscissa"]["unit"].to_string("latex_inline")
-            + "]",
-        )
-        ax.set_ylabel(
-            self.units["ordinate"]["label"]
-            + " ["
-            + self.units["ordinate"]["unit"].to_string("latex_inline")
-            + "]",
-        )
+        colors = self._rainbow(len(self.uids))
+
+        # Draw all spectra as a single collection.
+        segments = [
+            np.column_stack((d["frequency"], d["intensity"]))
+            for d in self.data.values()
+        ]
+        ax.add_collection(LineCollection(segments, colors=colors))
+        ax.autoscale_view()
+
+        ax.set_xlabel(self._axislabel("abscissa"))
+        ax.set_ylabel(self._axislabel("ordinate"))
 
         basename = keywords.get("save")
         if basename:
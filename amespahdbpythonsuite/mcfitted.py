@@ -5,9 +5,7 @@ from typing import Optional
 
 import os
 import numpy as np
-import matplotlib.pyplot as plt  # type: ignore
 
-from scipy import stats  # type: ignore
 from specutils import Spectrum1D  # type: ignore
 
 from amespahdbpythonsuite.amespahdb import AmesPAHdb
@@ -25,6 +23,13 @@ class MCFitted:
     def __init__(self, d: Optional[dict] = None, **keywords) -> None:
         self.__set(d, **keywords)
 
+    def set(self, d: Optional[dict] = None, **keywords) -> None:
+        """
+        Populate data dictionary, which resets the cached statistics.
+
+        """
+        self.__set(d, **keywords)
+
     def __set(self, d: Optional[dict] = None, **keywords) -> None:
         """
         Populate data dictionary helper.
@@ -63,7 +68,7 @@ class MCFitted:
 
         return d
 
-    def _getstats(self, d=list()) -> dict:
+    def _getstats(self, d=list(), axis: int = 0) -> dict:
         """
         Get statistics for the mcfitted spectra.
 
@@ -71,12 +76,32 @@ class MCFitted:
             stat : dictionary
 
         """
-        s = stats.describe(d)
+        a = np.asarray(d, dtype=float)
+        n = a.shape[axis]
+
+        # Compute the central moments from a single set of deviations,
+        # following scipy.stats.describe (ddof=1, biased skewness and
+        # Fisher kurtosis, NaN where the variance vanishes).
+        mean = a.mean(axis=axis, keepdims=True)
+        deviations = a - mean
+        squared = deviations**2
+        m2 = squared.mean(axis=axis)
+        m3 = (squared * deviations).mean(axis=axis)
+        m4 = (squared**2).mean(axis=axis)
+        mean = mean.squeeze(axis=axis)
+
+        with np.errstate(all="ignore"):
+            zero = m2 <= (np.finfo(float).eps * mean) ** 2
+            skew = np.where(zero, np.nan, m3 / m2**1.5)
+            kurt = np.where(zero, np.nan, m4 / m2**2.0) - 3
+            # NaN for a single sample, as with scipy.stats.describe.
+            std = np.sqrt(m2 * np.divide(n, n - 1, dtype=float))
+
         stat = {
-            "mean": s.mean,
-            "std": np.sqrt(s.variance),
-            "skew": s.skewness,
-            "kurt": s.kurtosis,
+            "mean": mean[()],
+            "std": std[()],
+            "skew": skew[()],
+            "kurt": kurt[()],
         }
 
         return stat
@@ -87,7 +112,10 @@ class MCFitted:
 
         """
         if self._fit is None:
-            self._fit = self._getstats([mcfit.getfit() for mcfit in self.mcfits])
+            fits = np.empty((len(self.mcfits), self.mcfits[0].grid.size))
+            for i, mcfit in enumerate(self.mcfits):
+                fits[i] = mcfit.getfit()
+            self._fit = self._getstats(fits)
 
         return self._fit
 
@@ -97,17 +125,22 @@ class MCFitted:
 
         """
         if self._breakdown is None:
-            mcfits = iter(self.mcfits)
-            mcfit = next(mcfits)
-            breakdown = mcfit.getbreakdown()
-            results: dict = {k: [] for k in breakdown.keys()}
-            for key, val in breakdown.items():
-                results[key].append(val)
-            for mcfit in mcfits:
-                breakdown = mcfit.getbreakdown()
-                for key, val in breakdown.items():
-                    results[key].append(val)
-            self._breakdown = {key: self._getstats(val) for key, val in results.items()}
+            breakdowns = [mcfit.getbreakdown() for mcfit in self.mcfits]
+            # Not every sample reports every key, take them in order of
+            # first appearance.
+            keys = list(dict.fromkeys(key for b in breakdowns for key in b))
+
+            # Stack the breakdowns of all samples once, as (key, sample),
+            # where keys missing from a sample are zero.
+            results = np.zeros((len(keys), len(breakdowns)))
+            for i, breakdown in enumerate(breakdowns):
+                results[:, i] = [breakdown.get(key, 0.0) for key in keys]
+
+            stat = self._getstats(results, axis=1)
+            self._breakdown = {
+                key: {name: val[k] for name, val in stat.items()}
+                for k, key in enumerate(keys)
+            }
 
         return self._breakdown
 
@@ -117,26 +150,35 @@ class MCFitted:
 
         """
         if self._classes is None:
-            mcfits = iter(self.mcfits)
-            mcfit = next(mcfits)
-            classes = mcfit.getclasses()
-            results: dict = {k: [] for k in classes.keys()}
-            for key, val in classes.items():
-                results[key].append(val)
-            for mcfit in mcfits:
-                classes = mcfit.getclasses()
-                for key, val in classes.items():
-                    results[key].append(val)
-            self._classes = {key: self._getstats(val) for key, val in results.items()}
+            classes = [mcfit.getclasses() for mcfit in self.mcfits]
+            keys = list(classes[0].keys())
+
+            # Stack the class spectra of all samples once, as (class,
+            # sample, grid), where classes without PAHs are zero.
+            spectra = np.zeros((len(keys), len(classes), self.mcfits[0].grid.size))
+            for i, c in enumerate(classes):
+                for k, key in enumerate(keys):
+                    spectra[k, i] = c[key]
+
+            stat = self._getstats(spectra, axis=1)
+            self._classes = {
+                key: {name: val[k] for name, val in stat.items()}
+                for k, key in enumerate(keys)
+            }
 
         return self._classes
 
     def plot(self, **keywords):
         """
-        Plot the MC sampled fit and breakdown components.
+        Plot the MC sampled fit and breakdown components. Pass ax to draw
+        into existing axes, which are cleared first so that one figure can
+        be reused across calls.
 
         """
+        import matplotlib.pyplot as plt  # type: ignore
         from astropy.nddata import StdDevUncertainty  # type: ignore
+        from matplotlib.collections import LineCollection, PolyCollection  # type: ignore
+        from matplotlib.lines import Line2D  # type: ignore
 
         datalabel = keywords.get("datalabel", "obs")
 
@@ -146,32 +188,29 @@ class MCFitted:
         fit = self.getfit()
         components = self.getclasses()
 
-        # Plot.
-        fig, ax = plt.subplots()
+        # Plot, into the caller's axes when given, in which case the
+        # caller also owns the figure.
+        ax = keywords.get("ax")
+        owns_fig = ax is None
+        if owns_fig:
+            fig, ax = plt.subplots()
+        else:
+            fig = ax.figure
+            ax.clear()
 
         if keywords.get("wavelength", False):
             x = 1e4 / obs.spectral_axis.value
             xtitle = "Wavelength [micron]"
         else:
             x = obs.spectral_axis.value
-            xtitle = (
-                self.mcfits[0].units["abscissa"]["label"]
-                + " ["
-                + self.mcfits[0].units["abscissa"]["unit"].to_string("latex_inline")
-                + "]"
-            )
+            xtitle = self.mcfits[0]._axislabel("abscissa")
 
         ax.minorticks_on()
         ax.tick_params(which="major", right="on", top="on", direction="in", length=5)
         ax.tick_params(which="minor", right="on", top="on", direction="in", length=3)
-        ax.set_xlim((min(x), max(x)))
+        ax.set_xlim((x.min(), x.max()))
         ax.set_xlabel(f"{xtitle}")
-        ax.set_ylabel(
-            self.mcfits[0].units["ordinate"]["label"]
-            + " ["
-            + self.mcfits[0].units["ordinate"]["unit"].to_string("latex_inline")
-            + "]",
-        )
+        ax.set_ylabel(self.mcfits[0]._axislabel("ordinate"))
 
         if isinstance(obs.uncertainty, StdDevUncertainty):
             ax.errorbar(
@@ -204,139 +243,58 @@ class MCFitted:
             zorder=99,
         )
 
-        if keywords.get("charge"):
-            ptype = "charge"
-            if isinstance(components["anion"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["anion"]["mean"],
-                    color="tab:red",
-                    linewidth=1.2,
-                    label="anion",
-                    zorder=2,
-                )
-                ax.fill_between(
-                    x,
-                    components["anion"]["mean"] - components["anion"]["std"],
-                    components["anion"]["mean"] + components["anion"]["std"],
-                    color="tab:red",
-                    alpha=0.3,
-                    zorder=1,
-                )
-
-            if isinstance(components["neutral"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["neutral"]["mean"],
-                    color="tab:green",
-                    linewidth=1.2,
-                    label="neutral",
-                    zorder=4,
-                )
-                ax.fill_between(
-                    x,
-                    components["neutral"]["mean"] - components["neutral"]["std"],
-                    components["neutral"]["mean"] + components["neutral"]["std"],
-                    color="tab:green",
-                    alpha=0.3,
-                    zorder=3,
-                )
-
-            if isinstance(components["cation"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["cation"]["mean"],
-                    color="tab:blue",
-                    linewidth=1.2,
-                    label="cation",
-                    zorder=6,
-                )
-                ax.fill_between(
-                    x,
-                    components["cation"]["mean"] - components["cation"]["std"],
-                    components["cation"]["mean"] + components["cation"]["std"],
-                    color="tab:blue",
-                    alpha=0.3,
-                    zorder=5,
-                )
-
-        elif keywords.get("size"):
-            ptype = "size"
-            if isinstance(components["small"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["small"]["mean"],
-                    color="tab:red",
-                    label="small",
-                    zorder=2,
-                )
-                ax.fill_between(
-                    x,
-                    components["small"]["mean"] - components["small"]["std"],
-                    components["small"]["mean"] + components["small"]["std"],
-                    color="tab:red",
-                    alpha=0.3,
-                    zorder=1,
-                )
-
-            if isinstance(components["large"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["large"]["mean"],
-                    color="tab:green",
-                    label="large",
-                    zorder=4,
-                )
-                ax.fill_between(
-                    x,
-                    components["large"]["mean"] - components["large"]["std"],
-                    components["large"]["mean"] + components["large"]["std"],
-                    color="tab:green",
-                    alpha=0.3,
-                    zorder=3,
-                )
+        # Breakdown classes and colors for each plot type.
+        breakdowns = {
+            "charge": {"anion": "tab:red", "neutral": "tab:green", "cation": "tab:blue"},
+            "size": {"small": "tab:red", "large": "tab:green"},
+            "composition": {"pure": "tab:red", "nitrogen": "tab:green"},
+        }
 
-        elif keywords.get("composition"):
-            ptype = "composition"
-            if isinstance(components["pure"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["pure"]["mean"],
-                    color="tab:red",
-                    label="pure",
-                    zorder=2,
+        ptype = next((key for key in breakdowns if keywords.get(key)), "fitted")
+
+        # Draw the class spectra and their uncertainty bands as one
+        # line and one polygon collection, with proxies for the legend.
+        handles = list()
+        if ptype in breakdowns:
+            linewidth = 1.2 if ptype == "charge" else plt.rcParams["lines.linewidth"]
+            lines, colors, bands, bandcolors = list(), list(), list(), list()
+            for key, color in breakdowns[ptype].items():
+                mean, std = components[key]["mean"], components[key]["std"]
+                # Classes absent from every sample are all zero; skip them,
+                # and skip bands without any spread.
+                if not mean.any():
+                    continue
+                lines.append(np.column_stack((x, mean)))
+                colors.append(color)
+                handles.append(
+                    Line2D([], [], color=color, linewidth=linewidth, label=key)
                 )
-                ax.fill_between(
-                    x,
-                    components["pure"]["mean"] - components["pure"]["std"],
-                    components["pure"]["mean"] + components["pure"]["std"],
-                    color="tab:red",
-                    alpha=0.3,
-                    zorder=1,
-                )
-
-            if isinstance(components["nitrogen"]["mean"], np.ndarray):
-                ax.plot(
-                    x,
-                    components["nitrogen"]["mean"],
-                    color="tab:green",
-                    label="nitrogen",
-                    zorder=4,
+                if std.any():
+                    # Lower bound forward, upper bound backward, written
+                    # straight into the polygon's vertices.
+                    band = np.empty((2 * x.size, 2))
+                    band[: x.size, 0] = x
+                    band[x.size:, 0] = x[::-1]
+                    np.subtract(mean, std, out=band[: x.size, 1])
+                    np.add(mean[::-1], std[::-1], out=band[x.size:, 1])
+                    bands.append(band)
+                    bandcolors.append(color)
+
+            if bands:
+                ax.add_collection(
+                    PolyCollection(bands, color=bandcolors, alpha=0.3, zorder=1)
                 )
-                ax.fill_between(
-                    x,
-                    components["nitrogen"]["mean"] - components["nitrogen"]["std"],
-                    components["nitrogen"]["mean"] + components["nitrogen"]["std"],
-                    color="tab:green",
-                    alpha=0.3,
-                    zorder=3,
+            if lines:
+                ax.add_collection(
+                    LineCollection(lines, colors=colors, linewidths=linewidth, zorder=2)
                 )
-
-        else:
-            ptype = "fitted"
+                ax.autoscale_view()
 
         ax.axhline(0, linestyle="--", color="gray", zorder=0)
-        ax.legend(fontsize=10)
+        # Place the class proxies directly after the fit in the legend.
+        legend, labels = ax.get_legend_handles_labels()
+        i = labels.index("fit") + 1
+        ax.legend(handles=legend[:i] + handles + legend[i:], fontsize=10)
 
         if keywords.get("save", False):
             if keywords.get("output"):
@@ -350,10 +308,11 @@ class MCFitted:
                     )
             else:
                 fig.savefig(f"mc_{ptype}_breakdown.{keywords['ftype']}")
-        else:
+        elif owns_fig:
             plt.show()
 
-        plt.close(fig)
+        if owns_fig:
+            plt.close(fig)
 
     def write(self, filename: str = "") -> None:
         """
@@ -388,7 +347,13 @@ class MCFitted:
             else:
                 hdr.append(f"{key:8} = {value}")
 
+        rows = [
+            (key, vals["mean"], vals["std"], vals["skew"], vals["kurt"])
+            for key, vals in self.getbreakdown().items()
+        ]
+
         tbl = Table(
+            rows=rows,
             names=("attribute", "mean", "std", "skew", "kurt"),
             dtype=(
                 "U25",
@@ -400,9 +365,6 @@ class MCFitted:
             meta={"comments": hdr},
         )
 
-        for key, vals in self.getbreakdown().items():
-            tbl.add_row([key, vals["mean"], vals["std"], vals["skew"], vals["kurt"]])
-
         tbl.write(filename, format="ipac", overwrite=True)
 
         message(f"WRITTEN: {filename}")
@@ -414,17 +376,19 @@ class MCFitted:
 
         """
         if self._error is None:
-            mcfits = iter(self.mcfits)
-            mcfit = next(mcfits)
-            error = mcfit.geterror()
-            results: dict = {k: [] for k in error.keys()}
-            for key, val in error.items():
-                results[key].append(val)
-            for mcfit in mcfits:
-                error = mcfit.geterror()
-                for key, val in error.items():
-                    results[key].append(val)
-            self._error = {key: self._getstats(val) for key, val in results.items()}
+            errors = [mcfit.geterror() for mcfit in self.mcfits]
+            keys = list(errors[0].keys())
+
+            # Stack the errors of all samples once, as (key, sample).
+            results = np.empty((len(keys), len(errors)))
+            for i, error in enumerate(errors):
+                results[:, i] = [error[key] for key in keys]
+
+            stat = self._getstats(results, axis=1)
+            self._error = {
+                key: {name: val[k] for name, val in stat.items()}
+                for k, key in enumerate(keys)
+            }
 
         return self._error
 
@@ -440,8 +404,9 @@ class MCFitted:
         Retrieves the statistics spectra for the residuals of the MC fits.
         """
         if self._residual is None:
-            self._residual = self._getstats(
-                [mcfit.getresidual() for mcfit in self.mcfits]
-            )
+            residuals = np.empty((len(self.mcfits), self.mcfits[0].grid.size))
+            for i, mcfit in enumerate(self.mcfits):
+                residuals[i] = mcfit.getresidual()
+            self._residual = self._getstats(residuals)
 
         return self._residual
@@ -255,13 +255,12 @@ class Spectrum(Transitions):
         Plot the spectrum.
 
         """
-        import matplotlib as mpl  # type: ignore
         import matplotlib.pyplot as plt  # type: ignore
 
         _, ax = plt.subplots()
         ax.minorticks_on()
         ax.tick_params(which="major", right="on", top="on", direction="in")
-        colors = mpl.colormaps["rainbow"](np.linspace(0, 1, len(self.uids)))
+        colors = self._rainbow(len(self.uids))
         for y, col in zip(self.data.values(), colors):
             ax.plot(self.grid, y, color=col)
 
@@ -500,10 +499,12 @@ class Spectrum(Transitions):
                         data[uid] = s * m * obs.flux.unit
                         weights[uid] = s
 
+                # Only the flux differs between samples; the spectral
+                # axis and uncertainties are shared with the observation.
                 obs_fit = Spectrum1D(
                     flux=b * obs.flux.unit,
-                    spectral_axis=copy.deepcopy(obs.spectral_axis),
-                    uncertainty=copy.deepcopy(obs.uncertainty),
+                    spectral_axis=obs.spectral_axis,
+                    uncertainty=obs.uncertainty,
                 )
 
                 mcfits.append(
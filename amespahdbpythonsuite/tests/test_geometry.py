@@ -5,6 +5,7 @@ test_geometry.py
 Test the geometry.py module.
 """
 
+import copy
 import pytest
 from pkg_resources import resource_filename
 from os.path import exists
@@ -88,9 +89,21 @@ class TestGeometry:
     def test_mass(self, test_geometry, test_masses):
         assert test_geometry.mass() == test_masses
 
+    def test_mass_empty(self, test_geometry):
+        d = copy.deepcopy(test_geometry.get())
+        data = d["data"]
+        d["data"] = {18: data[18], 1: [], 73: data[73], 2: []}
+        mass = geometry.Geometry(d).mass()
+        assert mass[1] == 0.0 and mass[2] == 0.0
+        assert mass[73] == test_geometry.mass()[73]
+        d["data"] = {1: []}
+        assert geometry.Geometry(d).mass() == {1: 0.0}
+
     def test_inertia(self, test_geometry, test_tensor):
         inertia = test_geometry.inertia()[18]
         np.testing.assert_allclose(inertia, test_tensor)
+        for tensor in test_geometry.inertia().values():
+            assert (tensor == tensor.T).all()
 
     def test_diagonalize(self, test_geometry, test_diagonalized):
         test_geometry.diagonalize()
@@ -98,10 +111,34 @@ class TestGeometry:
         x = [d["x"] for d in g["data"][18]]
         np.testing.assert_allclose(x, test_diagonalized)
 
+    def test_diagonalize_full(self, test_geometry):
+        g = geometry.Geometry(copy.deepcopy(test_geometry.get()))
+        g.diagonalize(full=True)
+        tensor = g.inertia()[18]
+        np.testing.assert_allclose(tensor - np.diag(np.diag(tensor)), 0.0, atol=1e-8)
+
+    def test_data_inplace(self, test_geometry):
+        g = geometry.Geometry(copy.deepcopy(test_geometry.get()))
+        inertia = g.inertia()[18]
+        assert g.area()[18] > 0.0
+        for atom in g.data[18]:
+            atom["x"] *= 2.0
+            atom["y"] *= 2.0
+            atom["z"] *= 2.0
+        np.testing.assert_allclose(g.inertia()[18], 4.0 * inertia)
+        # Stretched beyond bonding distance, no rings remain.
+        assert sum(g.rings()[18].values()) == 0
+        assert g.area()[18] == 0.0
+
     def test_rings(self, test_geometry, test_nrings):
         rings = test_geometry.rings()
         assert rings[726] == test_nrings
 
+    def test_rings_multiprocessing(self, test_geometry, test_nrings):
+        g = geometry.Geometry(test_geometry.get())
+        rings = g.rings(multiprocessing=True, ncores=2)
+        assert rings[726] == test_nrings
+
     def test_area(self, test_geometry, test_areas):
         areas = test_geometry.area()
         assert areas == test_areas
@@ -109,6 +146,10 @@ class TestGeometry:
     def test_bec(self, test_geometry):
         assert test_geometry.bec()[18] == "333333"
 
+    def test_bec_multiprocessing(self, test_geometry):
+        becodes = test_geometry.bec(multiprocessing=True, ncores=2)
+        assert becodes == test_geometry.bec()
+
     def test_getset(self, test_geometry):
         g1 = test_geometry.get()
         assert g1["type"] == "Geometry"
@@ -5,9 +5,11 @@ test_mcfitted.py
 Test the mcfitted.py module.
 """
 
+import copy
 import pytest
 from os.path import exists
 import matplotlib.pyplot as plt
+import numpy as np
 
 from pkg_resources import resource_filename
 
@@ -64,6 +66,14 @@ class TestMCFitted:
         breakdown = test_mcfitted.getbreakdown()
         assert len(breakdown.keys()) == 14
 
+    def test_getbreakdown_keys(self, monkeypatch, test_mcfitted):
+        mcfits = [copy.copy(mcfit) for mcfit in test_mcfitted.mcfits]
+        breakdown = mcfits[0].getbreakdown()
+        del breakdown["pure"]
+        monkeypatch.setattr(mcfits[0], "getbreakdown", lambda: breakdown)
+        m = mcfitted.MCFitted(test_mcfitted.get(), mcfits=mcfits)
+        assert set(m.getbreakdown()) == set(test_mcfitted.getbreakdown())
+
     def test_plot(self, monkeypatch, test_mcfitted):
         monkeypatch.setattr(plt, "show", lambda: None)
         test_mcfitted.plot(show=True)
@@ -86,6 +96,40 @@ class TestMCFitted:
         )
         assert exists(f"{test_path}mc_composition_breakdown.pdf")
 
+    def test_getset(self, test_mcfitted):
+        m1 = test_mcfitted.get()
+        assert m1["type"] == "MCFitted"
+        mcfitted2 = mcfitted.MCFitted()
+        mcfitted2.set(m1)
+        assert mcfitted2.get()["mcfits"] is m1["mcfits"]
+        fit = mcfitted2.getfit()
+        mcfitted2.set(m1, mcfits=m1["mcfits"][:5])
+        assert mcfitted2.getfit() is not fit
+
+    def test_single_sample(self, test_mcfitted):
+        m = mcfitted.MCFitted(test_mcfitted.get(), mcfits=test_mcfitted.mcfits[:1])
+        fit = m.getfit()
+        np.testing.assert_array_equal(fit["mean"], test_mcfitted.mcfits[0].getfit())
+        assert np.isnan(fit["std"]).all()
+        assert all(np.isnan(b["std"]) for b in m.getbreakdown().values())
+
+    def test_plot_ax(self, test_mcfitted):
+        fig, ax = plt.subplots()
+        test_mcfitted.plot(charge=True, ax=ax)
+        assert plt.fignum_exists(fig.number)
+        n = len(ax.collections)
+        assert n > 0
+        test_mcfitted.plot(charge=True, ax=ax)
+        assert len(ax.collections) == n
+        assert ax.get_legend_handles_labels()[1].count("fit") == 1
+        plt.close(fig)
+
+    def test_plot_ax_none(self, monkeypatch, test_mcfitted):
+        monkeypatch.setattr(plt, "show", lambda: None)
+        figures = plt.get_fignums()
+        test_mcfitted.plot(ax=None)
+        assert plt.get_fignums() == figures
+
     def test_write(self, test_path, test_mcfitted):
         test_mcfitted.write(filename=f"{test_path}mc_breakdown.tbl")
         assert exists(f"{test_path}mc_breakdown.tbl")
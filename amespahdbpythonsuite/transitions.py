@@ -873,13 +873,12 @@ class Transitions(Data):
         Plot the transitions absorption spectrum.
 
         """
-        import matplotlib as mpl  # type: ignore
         import matplotlib.pyplot as plt  # type: ignore
 
         _, ax = plt.subplots()
         ax.minorticks_on()
         ax.tick_params(which="major", right="on", top="on", direction="in", axis="both")
-        colors = mpl.colormaps["rainbow"](np.linspace(0, 1, len(self.uids)))
+        colors = self._rainbow(len(self.uids))
 
         for uid, col in zip(self.uids, colors):
             f = [v for v in self.data[uid]]
@@ -195,6 +195,10 @@ class XMLparser:
                 break
 
             elem.clear()
+            # Drop already parsed siblings, cleared elements otherwise
+            # remain attached to <species>.
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
         return species
 